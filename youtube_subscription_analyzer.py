@@ -7,17 +7,34 @@ you haven't watched in over one year based on your viewing history.
 """
 
 import os
-import pickle
 import json
+import mmap
+import re
+import shelve
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from functools import partial
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson  # Optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streaming JSON parsing for huge history files
+except ImportError:
+    ijson = None
 
 # YouTube API scopes required for reading subscriptions and watch history
 SCOPES = [
@@ -31,19 +48,50 @@ SCOPES_WITH_WRITE = [
     'https://www.googleapis.com/auth/youtube.force-ssl'
 ]
 
-def get_authenticated_service():
+# Base URL of a channel page, followed by the channel ID
+URL_PREFIX = 'https://www.youtube.com/channel/'
+
+# Channel ID or @handle in a channel URL, e.g.
+# https://www.youtube.com/channel/CHANNEL_ID or https://www.youtube.com/@username
+CHANNEL_URL_RE = re.compile(r'/(?:channel/([^/?#\s]+)|@([^/?#\s]+))')
+
+# Number of batch requests kept in flight when resolving channel handles
+MAX_RESOLVE_WORKERS = 16
+
+# Maximum number of calls the API accepts in a single batch request
+BATCH_SIZE = 50
+
+# On-disk cache of API responses, revalidated with ETags once stale
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'yt_sub_analyzer.db')
+
+# How long a cached subscriptions page is used without asking the server
+SUBSCRIPTIONS_CACHE_TTL = timedelta(hours=1)
+
+# Watch history saved by previous runs, so later runs only process newer entries
+HISTORY_CACHE_FILE = 'history_cache.json'
+
+# Watch history files larger than this are streamed with ijson (if installed)
+# rather than parsed into memory all at once
+STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# Number of watch history entries processed between progress updates
+PROGRESS_BLOCK_SIZE = 10000
+
+# Per-thread storage for YouTube service instances (httplib2 is not thread-safe)
+_thread_local = threading.local()
+
+def get_credentials() -> Credentials:
     """
-    Authenticate with YouTube API and return the service object.
+    Load saved OAuth credentials, refreshing or re-authorizing as needed.
     
     Returns:
-        Resource: An authorized YouTube API service instance.
+        Credentials: Valid OAuth credentials for the YouTube API.
     """
     creds = None
     
     # Token file stores the user's access and refresh tokens
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
+    if os.path.exists('token.json'):
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
     
     # If there are no valid credentials, let the user log in
     if not creds or not creds.valid:
@@ -58,19 +106,124 @@ def get_authenticated_service():
             flow = InstalledAppFlow.from_client_secrets_file(
                 'credentials.json', SCOPES)
             creds = flow.run_local_server(port=0)
+            
+            # A new sign-in may be a different account, whose subscriptions
+            # must not be served from the previous account's cached pages
+            RequestCache().clear()
         
         # Save the credentials for the next run
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
+        with open('token.json', 'w', encoding='utf-8') as token:
+            token.write(creds.to_json())
+    
+    return creds
+
+class _OrjsonModel(JsonModel):
+    """
+    JSON model that decodes API responses with orjson instead of json.
+    """
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel: non-JSON bodies are returned as decoded text
+            if isinstance(content, bytes):
+                content = content.decode('utf-8')
+            return content
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+def get_authenticated_service(creds: Credentials = None):
+    """
+    Authenticate with YouTube API and return the service object.
+    
+    Args:
+        creds: OAuth credentials to use. Obtained via get_credentials() if omitted.
+        
+    Returns:
+        Resource: An authorized YouTube API service instance.
+    """
+    if creds is None:
+        creds = get_credentials()
+    
+    model = _OrjsonModel() if orjson is not None else None
+    return build('youtube', 'v3', credentials=creds, model=model)
+
+def _get_thread_service(creds: Credentials):
+    """
+    Return a YouTube service instance owned by the calling thread.
+    
+    The service is built on first use and reused for later calls from the
+    same thread, since its underlying HTTP connection cannot be shared.
+    """
+    youtube = getattr(_thread_local, 'youtube', None)
+    if youtube is None:
+        youtube = get_authenticated_service(creds)
+        _thread_local.youtube = youtube
+    return youtube
+
+class RequestCache:
+    """
+    Persistent cache for YouTube API list responses.
+    
+    Entries are keyed by request URI and keep the response ETag, so once an
+    entry is older than its TTL it is revalidated with If-None-Match and the
+    server can answer 304 Not Modified instead of resending the page.
+    """
+    
+    def __init__(self, path: str = CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+    
+    def execute(self, request, ttl: timedelta) -> Dict:
+        """
+        Execute an API request, serving it from the cache where possible.
+        
+        Args:
+            request: The googleapiclient request to execute.
+            ttl: How long a cached response is used without revalidation.
+            
+        Returns:
+            The response body.
+        """
+        key = request.uri
+        with shelve.open(self.path) as db:
+            cached = db.get(key)
+        
+        if cached is not None:
+            etag, response, fetched_at = cached
+            if datetime.now() - fetched_at < ttl:
+                return response
+            if etag:
+                request.headers['If-None-Match'] = etag
+        
+        try:
+            response = request.execute()
+        except HttpError as e:
+            if cached is None or e.resp.status != 304:
+                raise
+            response = cached[1]  # Not modified since we cached it
+        
+        with shelve.open(self.path) as db:
+            db[key] = (response.get('etag'), response, datetime.now())
+        
+        return response
     
-    return build('youtube', 'v3', credentials=creds)
+    def clear(self):
+        """
+        Drop all cached responses, e.g. after subscriptions were changed.
+        """
+        with shelve.open(self.path, flag='n'):
+            pass
 
-def get_all_subscriptions(youtube) -> List[Dict]:
+def get_all_subscriptions(youtube, cache: RequestCache = None) -> List[Dict]:
     """
     Fetch all channel subscriptions for the authenticated user.
     
     Args:
         youtube: Authenticated YouTube API service instance.
+        cache: Optional response cache used to avoid re-downloading pages.
         
     Returns:
         List of subscription objects containing channel information.
@@ -85,9 +238,14 @@ def get_all_subscriptions(youtube) -> List[Dict]:
                 part='snippet',
                 mine=True,
                 maxResults=50,
+                # Only request the fields we actually use to shrink responses
+                fields='etag,nextPageToken,items(id,snippet(title,resourceId/channelId))',
                 pageToken=next_page_token
             )
-            response = request.execute()
+            if cache is not None:
+                response = cache.execute(request, SUBSCRIPTIONS_CACHE_TTL)
+            else:
+                response = request.execute()
             
             subscriptions.extend(response.get('items', []))
             next_page_token = response.get('nextPageToken')
@@ -104,16 +262,69 @@ def get_all_subscriptions(youtube) -> List[Dict]:
     print(f"Total subscriptions found: {len(subscriptions)}")
     return subscriptions
 
-def load_watch_history_from_file(file_path: str, cutoff_date: datetime) -> Dict[str, datetime]:
+def _iter_watch_history(file_path: str):
+    """
+    Yield the entries of a Google Takeout watch history file.
+    
+    Files above STREAM_THRESHOLD_BYTES are streamed with ijson when it is
+    installed, so only one entry is in memory at a time. Smaller files are
+    parsed in one go, which is considerably faster; with orjson the file is
+    memory-mapped rather than read into a separate buffer.
+    
+    Args:
+        file_path: Path to the watch-history.json file from Google Takeout.
+    """
+    if ijson is not None and os.path.getsize(file_path) > STREAM_THRESHOLD_BYTES:
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+    
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            # orjson parses straight from the mapped file, so the raw bytes
+            # are never copied into memory alongside the parsed entries
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                watch_history = orjson.loads(view)
+        else:
+            watch_history = json.loads(f.read())
+    
+    yield from watch_history
+
+def _parse_timestamp(time_str: str) -> datetime:
+    """
+    Parse a Takeout timestamp (e.g. 2024-12-31T12:34:56.789Z) into a naive datetime.
+    
+    Args:
+        time_str: The ISO-8601 timestamp from a watch history entry.
+        
+    Returns:
+        The timestamp as a naive UTC datetime.
+        
+    Raises:
+        ValueError: If the timestamp is not in a recognized format.
+    """
+    try:
+        watched_at = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+    except ValueError:
+        # Before Python 3.11, fromisoformat only accepts 3 or 6 fractional digits
+        watched_at = datetime.strptime(time_str, '%Y-%m-%dT%H:%M:%S.%fZ')
+    return watched_at.replace(tzinfo=None)  # Make naive
+
+def load_watch_history_from_file(file_path: str, cutoff_date: datetime,
+                                 keep_ids: FrozenSet[str] = None
+                                 ) -> Tuple[Dict[str, datetime], Dict[str, datetime]]:
     """
     Load watch history from a Google Takeout JSON file.
     
     Args:
         file_path: Path to the watch-history.json file from Google Takeout.
         cutoff_date: The date to look back from (e.g., 1 year ago).
+        keep_ids: If given, only these channel IDs are recorded. Handles are
+            always kept since they can't be matched before being resolved.
         
     Returns:
-        Dictionary mapping channel IDs to their most recent view date.
+        Tuple of (by_channel_id, by_handle) dictionaries mapping channel IDs
+        and @username handles respectively to their most recent view date.
     """
     print(f"\nLoading watch history from file: {file_path}")
     print(f"Looking for videos watched since: {cutoff_date.strftime('%Y-%m-%d')}")
@@ -131,102 +342,262 @@ def load_watch_history_from_file(file_path: str, cutoff_date: datetime) -> Dict[
             "  7. Place 'watch-history.json' in this directory"
         )
     
-    channel_last_watched = defaultdict(lambda: None)
+    # Latest (raw timestamp, parsed datetime) per channel; ISO-8601
+    # timestamps sort chronologically as plain strings, so a timestamp is
+    # only parsed when it would replace the channel's current latest one
+    channel_last_seen = {}
+    
+    # The same channel URLs repeat across many entries, so each distinct URL
+    # is parsed once ('' marks URLs without a channel) and its ID shared
+    channel_ids_by_url = {}
+    
     videos_checked = 0
     videos_in_timeframe = 0
     
+    # Entries older than this can be skipped without parsing their timestamp
+    cutoff_str = cutoff_date.strftime('%Y-%m-%dT%H:%M:%S')
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            watch_history = json.load(f)
+        entries = _iter_watch_history(file_path)
         
-        print(f"Loaded {len(watch_history)} entries from watch history file")
-        
-        for entry in watch_history:
-            videos_checked += 1
-            
-            # Google Takeout format uses 'time' field
-            time_str = entry.get('time')
-            if not time_str:
-                continue
+        # Work through the entries in blocks so progress is reported once per
+        # block rather than checked on every entry
+        while True:
+            block = list(islice(entries, PROGRESS_BLOCK_SIZE))
+            if not block:
+                break
             
-            # Parse the timestamp (format: 2024-12-31T12:34:56.789Z)
-            try:
-                # Handle different possible timestamp formats
-                time_str = time_str.replace('+00:00', 'Z')
-                if '.' in time_str:
-                    # Has milliseconds
-                    watched_at = datetime.strptime(time_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-                else:
-                    # No milliseconds
-                    watched_at = datetime.strptime(time_str, '%Y-%m-%dT%H:%M:%SZ')
-            except ValueError:
-                # Try alternate formats
-                try:
-                    watched_at = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                    watched_at = watched_at.replace(tzinfo=None)  # Make naive
-                except:
+            for entry in block:
+                # Google Takeout format uses 'time' field
+                time_str = entry.get('time')
+                if not time_str or time_str < cutoff_str:
                     continue
+                
+                # The subtitles array contains channel info; entries without it
+                # (e.g. removed videos) can't be attributed to any channel
+                subtitles = entry.get('subtitles')
+                if not subtitles:
+                    continue
+                
+                videos_in_timeframe += 1
+                
+                # Extract channel information
+                channel_url = None
+                
+                for subtitle in subtitles:
+                    if 'url' in subtitle:
+                        channel_url = subtitle['url']
+                        break
+                
+                if channel_url:
+                    channel_id = channel_ids_by_url.get(channel_url)
+                    if channel_id is None:
+                        # Extract channel ID from URL
+                        match = CHANNEL_URL_RE.search(channel_url)
+                        if not match:
+                            channel_id = ''
+                        elif match.group(1):
+                            channel_id = match.group(1)
+                            # Views of channels we aren't subscribed to don't matter
+                            if keep_ids is not None and channel_id not in keep_ids:
+                                channel_id = ''
+                        else:
+                            # For @username format, we'll use the handle as identifier
+                            # (we'll need to look it up via API later if needed)
+                            channel_id = '@' + match.group(2)
+                        channel_ids_by_url[channel_url] = channel_id
+                    if not channel_id:
+                        continue
+                    
+                    # Update the last watched time for this channel, skipping
+                    # unparseable timestamps so they can't hide valid views
+                    previous = channel_last_seen.get(channel_id)
+                    if previous is None or time_str > previous[0]:
+                        try:
+                            watched_at = _parse_timestamp(time_str)
+                        except ValueError:
+                            continue
+                        channel_last_seen[channel_id] = (time_str, watched_at)
             
-            # Only process videos within our timeframe
+            videos_checked += len(block)
+            print(f"  Processed {videos_checked:,} entries... ({videos_in_timeframe:,} in timeframe)")
+        
+        by_channel_id = {}
+        by_handle = {}
+        for channel_id, (time_str, watched_at) in channel_last_seen.items():
+            # The string check above ignores sub-second precision
             if watched_at < cutoff_date:
                 continue
             
-            videos_in_timeframe += 1
-            
-            # Extract channel information
-            # Google Takeout format: "titleUrl" contains the video URL
-            title_url = entry.get('titleUrl', '')
-            
-            # The subtitles array contains channel info
-            subtitles = entry.get('subtitles', [])
-            channel_url = None
-            channel_name = None
-            
-            for subtitle in subtitles:
-                if 'url' in subtitle:
-                    channel_url = subtitle['url']
-                    channel_name = subtitle.get('name', '')
-                    break
-            
-            if channel_url:
-                # Extract channel ID from URL
-                # Format: https://www.youtube.com/channel/CHANNEL_ID
-                # or: https://www.youtube.com/@username
-                if '/channel/' in channel_url:
-                    channel_id = channel_url.split('/channel/')[-1].strip()
-                elif '/@' in channel_url:
-                    # For @username format, we'll use the username as identifier
-                    # (we'll need to look it up via API later if needed)
-                    channel_id = channel_url.split('/@')[-1].strip()
-                else:
-                    continue
-                
-                # Update the last watched date for this channel
-                if channel_last_watched[channel_id] is None or watched_at > channel_last_watched[channel_id]:
-                    channel_last_watched[channel_id] = watched_at
-            
-            if videos_checked % 1000 == 0:
-                print(f"  Processed {videos_checked:,} entries... ({videos_in_timeframe:,} in timeframe)")
+            # Handles still need resolving to channel IDs via the API
+            if channel_id.startswith('@'):
+                by_handle[channel_id] = watched_at
+            else:
+                by_channel_id[channel_id] = watched_at
         
         print(f"\nProcessing complete:")
         print(f"  Total entries in file: {videos_checked:,}")
         print(f"  Videos watched since cutoff: {videos_in_timeframe:,}")
-        print(f"  Unique channels found: {len(channel_last_watched):,}")
+        print(f"  Unique channels found: {len(by_channel_id) + len(by_handle):,}")
         
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON file format: {e}")
     except Exception as e:
         raise Exception(f"Error reading watch history file: {e}")
     
-    return dict(channel_last_watched)
+    return by_channel_id, by_handle
+
+def merge_latest(target: Dict[str, datetime], updates: Iterable[Tuple[str, datetime]]):
+    """
+    Merge last-watched dates into target, keeping the later date per channel.
+    
+    Args:
+        target: Dictionary mapping channel identifiers to last watch dates.
+        updates: (channel identifier, watch date) pairs to merge in.
+    """
+    for channel_id, watched_at in updates:
+        previous = target.get(channel_id)
+        if previous is None or watched_at > previous:
+            target[channel_id] = watched_at
+
+def load_watch_history(file_path: str, cutoff_date: datetime,
+                       keep_ids: FrozenSet[str] = None
+                       ) -> Tuple[Dict[str, datetime], Dict[str, datetime]]:
+    """
+    Load watch history, reusing the results saved by previous runs.
+    
+    If the file is unchanged since the last run (same path, size and
+    modification time) the saved history is used as is. Otherwise only
+    entries newer than the latest view seen last time are processed; they
+    are merged into the saved history, which is then written back.
+    
+    Args:
+        file_path: Path to the watch-history.json file from Google Takeout.
+        cutoff_date: The date to look back from (e.g., 1 year ago).
+        keep_ids: If given, only these channel IDs (plus any handles) are
+            recorded; see load_watch_history_from_file.
+        
+    Returns:
+        Tuple of (by_channel_id, by_handle) dictionaries mapping channel IDs
+        and @username handles respectively to their most recent view date.
+    """
+    by_channel_id = {}
+    by_handle = {}
+    since = cutoff_date
+    
+    try:
+        stat = os.stat(file_path)
+        source = [os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns]
+    except OSError:
+        source = None  # Missing file is reported by the loader below
+    
+    if os.path.exists(HISTORY_CACHE_FILE):
+        try:
+            with open(HISTORY_CACHE_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            
+            # History saved for a narrower set of subscriptions lacks the
+            # channels subscribed to since, which would then look unwatched
+            saved_keep_ids = saved['keep_ids']
+            if saved_keep_ids is not None and (keep_ids is None or not keep_ids <= frozenset(saved_keep_ids)):
+                raise ValueError("Saved watch history covers different subscriptions")
+            
+            def recent(history):
+                parsed = {
+                    channel_id: datetime.fromisoformat(watched_at)
+                    for channel_id, watched_at in history.items()
+                }
+                return {
+                    channel_id: watched_at
+                    for channel_id, watched_at in parsed.items()
+                    if watched_at >= cutoff_date
+                }
+            
+            by_channel_id = recent(saved['by_channel_id'])
+            by_handle = recent(saved['by_handle'])
+            
+            if source is not None and saved.get('source') == source:
+                print("\nWatch history file unchanged since last run, reusing saved results")
+                return by_channel_id, by_handle
+            
+            since = max(cutoff_date, datetime.fromisoformat(saved['as_of']))
+            print(f"\nReusing saved watch history up to {since.strftime('%Y-%m-%d %H:%M:%S')}")
+        except Exception:
+            # Unreadable or unusable cache: fall back to processing the whole file
+            by_channel_id = {}
+            by_handle = {}
+            since = cutoff_date
+    
+    new_by_channel_id, new_by_handle = load_watch_history_from_file(file_path, since, keep_ids)
+    merge_latest(by_channel_id, new_by_channel_id.items())
+    merge_latest(by_handle, new_by_handle.items())
+    
+    as_of = max(
+        max(by_channel_id.values(), default=since),
+        max(by_handle.values(), default=since)
+    )
+    with open(HISTORY_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'source': source,
+            'keep_ids': sorted(keep_ids) if keep_ids is not None else None,
+            'as_of': as_of.isoformat(),
+            'by_channel_id': {k: v.isoformat() for k, v in by_channel_id.items()},
+            'by_handle': {k: v.isoformat() for k, v in by_handle.items()}
+        }, f)
+    
+    return by_channel_id, by_handle
+
 
+def _resolve_handle_batch(creds: Credentials, handles: List[str]) -> Dict[str, str]:
+    """
+    Resolve a chunk of @username handles using a single batch HTTP request.
+    
+    Args:
+        creds: OAuth credentials used to build this thread's service.
+        handles: Up to BATCH_SIZE @username handles to resolve.
+        
+    Returns:
+        Dictionary mapping each handle to its channel ID, or to itself if it
+        could not be resolved.
+    """
+    youtube = _get_thread_service(creds)
+    resolved = {handle: handle for handle in handles}  # Keep original if not found
+    
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            return  # Keep original if lookup fails
+        items = response.get('items', [])
+        if items:
+            resolved[request_id] = items[0]['id']
+    
+    batch = youtube.new_batch_http_request(callback=on_response)
+    for handle in handles:
+        # Look the channel up by handle (1 quota unit, vs. 100 for a search)
+        batch.add(
+            youtube.channels().list(
+                part='id',
+                forHandle=handle,
+                fields='items/id'
+            ),
+            request_id=handle
+        )
+    
+    try:
+        batch.execute()
+    except HttpError:
+        pass  # Keep originals if the whole batch fails
+    
+    return resolved
 
-def resolve_channel_handles(youtube, channel_identifiers: List[str]) -> Dict[str, str]:
+def resolve_channel_handles(creds: Credentials, channel_identifiers: List[str]) -> Dict[str, str]:
     """
     Resolve @username handles to channel IDs using the YouTube API.
     
+    Lookups are packed into batch requests of up to BATCH_SIZE calls each,
+    and the batches are sent concurrently from a pool of worker threads.
+    
     Args:
-        youtube: Authenticated YouTube API service instance.
+        creds: OAuth credentials for the YouTube API.
         channel_identifiers: List of channel IDs or @username handles.
         
     Returns:
@@ -235,7 +606,8 @@ def resolve_channel_handles(youtube, channel_identifiers: List[str]) -> Dict[str
     resolved = {}
     handles_to_resolve = []
     
-    for identifier in channel_identifiers:
+    # dict.fromkeys drops duplicates while keeping the original order
+    for identifier in dict.fromkeys(channel_identifiers):
         if identifier.startswith('@') or not identifier.startswith('UC'):
             handles_to_resolve.append(identifier)
         else:
@@ -246,83 +618,117 @@ def resolve_channel_handles(youtube, channel_identifiers: List[str]) -> Dict[str
     
     print(f"\nResolving {len(handles_to_resolve)} channel handles to IDs...")
     
-    for handle in handles_to_resolve:
-        try:
-            # Search for the channel by handle
-            search_query = handle.replace('@', '')
-            request = youtube.search().list(
-                part='snippet',
-                q=search_query,
-                type='channel',
-                maxResults=1
-            )
-            response = request.execute()
-            
-            items = response.get('items', [])
-            if items:
-                channel_id = items[0]['id']['channelId']
-                resolved[handle] = channel_id
-            else:
-                resolved[handle] = handle  # Keep original if not found
-                
-        except HttpError:
-            resolved[handle] = handle  # Keep original if lookup fails
+    batches = [handles_to_resolve[i:i + BATCH_SIZE]
+               for i in range(0, len(handles_to_resolve), BATCH_SIZE)]
+    
+    with ThreadPoolExecutor(max_workers=MAX_RESOLVE_WORKERS) as executor:
+        for batch_resolved in executor.map(partial(_resolve_handle_batch, creds), batches):
+            resolved.update(batch_resolved)
     
     print(f"  Resolved {len([v for k, v in resolved.items() if k != v])} handles")
     
     return resolved
 
-def analyze_subscriptions(subscriptions: List[Dict], watch_history: Dict[str, datetime], 
+def index_subscriptions(subscriptions: List[Dict]) -> Dict[str, Dict]:
+    """
+    Index subscriptions by channel ID, keeping only the fields used later.
+    
+    Args:
+        subscriptions: List of subscription objects from the API.
+        
+    Returns:
+        Dictionary mapping channel IDs to their title and subscription ID,
+        in subscription order.
+    """
+    return {
+        sub['snippet']['resourceId']['channelId']: {
+            'title': sub['snippet']['title'],
+            'subscription_id': sub['id']  # This is needed for unsubscribing
+        }
+        for sub in subscriptions
+    }
+
+def _unwatched_entry(channel_id: str, sub: Dict, last_watched: datetime) -> Dict:
+    """
+    Build the report entry for a channel not watched since the cutoff.
+    
+    Args:
+        channel_id: The subscribed channel's ID.
+        sub: The indexed subscription for the channel.
+        last_watched: When the channel was last watched, or None.
+        
+    Returns:
+        Dictionary describing the channel and why it was flagged.
+    """
+    if last_watched is None:
+        # Never watched (or no record found)
+        reason = 'No viewing activity found'
+    else:
+        # Watched, but not in the last year
+        reason = f'Last watched {last_watched.strftime("%Y-%m-%d")}'
+    
+    return {
+        'title': sub['title'],
+        'channel_id': channel_id,
+        'subscription_id': sub['subscription_id'],
+        'last_watched': last_watched,
+        'reason': reason
+    }
+
+def analyze_subscriptions(subs_by_id: Dict[str, Dict], watch_history: Dict[str, datetime], 
                          cutoff_date: datetime) -> Tuple[List[Dict], List[Dict]]:
     """
     Analyze subscriptions to identify channels not watched in over a year.
     
     Args:
-        subscriptions: List of subscription objects.
+        subs_by_id: Subscriptions indexed by channel ID (see index_subscriptions).
         watch_history: Dictionary mapping channel IDs to last watch dates.
         cutoff_date: The date threshold (1 year ago).
         
     Returns:
         Tuple of (unwatched_channels, watched_channels).
     """
-    unwatched = []
-    watched = []
-    
-    for sub in subscriptions:
-        subscription_id = sub['id']  # This is needed for unsubscribing
-        channel_id = sub['snippet']['resourceId']['channelId']
-        channel_title = sub['snippet']['title']
-        
-        last_watched = watch_history.get(channel_id)
-        
-        if last_watched is None:
-            # Never watched (or no record found)
-            unwatched.append({
-                'title': channel_title,
-                'channel_id': channel_id,
-                'subscription_id': subscription_id,
-                'last_watched': None,
-                'reason': 'No viewing activity found'
-            })
-        elif last_watched < cutoff_date:
-            # Watched, but not in the last year
-            unwatched.append({
-                'title': channel_title,
-                'channel_id': channel_id,
-                'subscription_id': subscription_id,
-                'last_watched': last_watched,
-                'reason': f'Last watched {last_watched.strftime("%Y-%m-%d")}'
-            })
-        else:
-            # Watched within the last year
-            watched.append({
-                'title': channel_title,
-                'channel_id': channel_id,
-                'last_watched': last_watched
-            })
+    # Partition with set operations; the lists below keep subscription order
+    watched_ids = subs_by_id.keys() & {
+        channel_id for channel_id, last_watched in watch_history.items()
+        if last_watched >= cutoff_date
+    }
+    
+    unwatched = [
+        _unwatched_entry(channel_id, sub, watch_history.get(channel_id))
+        for channel_id, sub in subs_by_id.items()
+        if channel_id not in watched_ids
+    ]
+    watched = [
+        {
+            'title': sub['title'],
+            'channel_id': channel_id,
+            'last_watched': watch_history[channel_id]
+        }
+        for channel_id, sub in subs_by_id.items()
+        if channel_id in watched_ids
+    ]
     
     return unwatched, watched
 
+def render_unwatched(unwatched: List[Dict]) -> str:
+    """
+    Render the numbered list of unwatched channels shown in reports.
+    
+    Args:
+        unwatched: List of channels not watched in over a year.
+        
+    Returns:
+        One block per channel, separated by blank lines.
+    """
+    return '\n\n'.join(
+        f"{i}. {channel['title']}\n"
+        f"   Channel ID: {channel['channel_id']}\n"
+        f"   Status: {channel['reason']}\n"
+        f"   URL: {URL_PREFIX}{channel['channel_id']}"
+        for i, channel in enumerate(unwatched, 1)
+    )
+
 def print_results(unwatched: List[Dict], watched: List[Dict], total: int):
     """
     Print the analysis results in a readable format.
@@ -344,24 +750,21 @@ def print_results(unwatched: List[Dict], watched: List[Dict], total: int):
         print("\n" + "-" * 80)
         print("CHANNELS NOT WATCHED IN OVER ONE YEAR:")
         print("-" * 80)
-        
-        for i, channel in enumerate(unwatched, 1):
-            print(f"\n{i}. {channel['title']}")
-            print(f"   Channel ID: {channel['channel_id']}")
-            print(f"   Status: {channel['reason']}")
-            print(f"   URL: https://www.youtube.com/channel/{channel['channel_id']}")
+        print("\n" + render_unwatched(unwatched))
     else:
         print("\nGreat! You've watched videos from all your subscribed channels in the last year.")
     
     print("\n" + "=" * 80)
 
-def unsubscribe_from_channels(youtube, channels: List[Dict]) -> Tuple[int, int]:
+def unsubscribe_from_channels(youtube, channels: List[Dict],
+                              cache: RequestCache = None) -> Tuple[int, int]:
     """
     Unsubscribe from a list of channels.
     
     Args:
         youtube: Authenticated YouTube API service instance.
         channels: List of channel dictionaries with subscription_id.
+        cache: Response cache to invalidate once any subscription is removed.
         
     Returns:
         Tuple of (successful_count, failed_count).
@@ -385,16 +788,21 @@ def unsubscribe_from_channels(youtube, channels: List[Dict]) -> Tuple[int, int]:
             print(f"      Error: {e._get_reason()}")
             failed += 1
     
+    # Cached subscription pages no longer reflect reality
+    if successful and cache is not None:
+        cache.clear()
+    
     return successful, failed
 
 
-def interactive_unsubscribe(youtube, unwatched: List[Dict]):
+def interactive_unsubscribe(youtube, unwatched: List[Dict], cache: RequestCache = None):
     """
     Prompt user to selectively unsubscribe from channels.
     
     Args:
         youtube: Authenticated YouTube API service instance.
         unwatched: List of unwatched channel dictionaries.
+        cache: Response cache to invalidate after unsubscribing.
     """
     if not unwatched:
         return
@@ -417,7 +825,7 @@ def interactive_unsubscribe(youtube, unwatched: List[Dict]):
         confirm = input("Are you sure? Type 'YES' to confirm: ").strip()
         
         if confirm == 'YES':
-            successful, failed = unsubscribe_from_channels(youtube, unwatched)
+            successful, failed = unsubscribe_from_channels(youtube, unwatched, cache)
             print(f"\n" + "=" * 80)
             print(f"UNSUBSCRIBE COMPLETE")
             print(f"Successfully unsubscribed: {successful}")
@@ -459,7 +867,7 @@ def interactive_unsubscribe(youtube, unwatched: List[Dict]):
                 confirm = input("Type 'YES' to confirm: ").strip()
                 
                 if confirm == 'YES':
-                    successful, failed = unsubscribe_from_channels(youtube, selected_channels)
+                    successful, failed = unsubscribe_from_channels(youtube, selected_channels, cache)
                     print(f"\n" + "=" * 80)
                     print(f"UNSUBSCRIBE COMPLETE")
                     print(f"Successfully unsubscribed: {successful}")
@@ -479,45 +887,63 @@ def interactive_unsubscribe(youtube, unwatched: List[Dict]):
 
 def save_results_to_file(unwatched: List[Dict], watched: List[Dict]):
     """
-    Save analysis results to a text file for future reference.
+    Save analysis results to text and JSON files for future reference.
     
     Args:
         unwatched: List of channels not watched in over a year.
         watched: List of channels watched in the last year.
     """
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    generated = datetime.now()
+    timestamp = generated.strftime('%Y%m%d_%H%M%S')
     filename = f'youtube_subscription_analysis_{timestamp}.txt'
+    json_filename = f'youtube_subscription_analysis_{timestamp}.json'
+    
+    parts = [
+        "YOUTUBE SUBSCRIPTION ANALYSIS RESULTS\n",
+        f"Generated: {generated.strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "=" * 80 + "\n\n",
+        f"Total Subscriptions: {len(unwatched) + len(watched)}\n",
+        f"Watched in last year: {len(watched)}\n",
+        f"NOT watched in last year: {len(unwatched)}\n\n"
+    ]
+    
+    if unwatched:
+        parts.append("-" * 80 + "\n")
+        parts.append("CHANNELS NOT WATCHED IN OVER ONE YEAR:\n")
+        parts.append("-" * 80 + "\n\n")
+        parts.append(render_unwatched(unwatched) + "\n\n")
     
+    if watched:
+        parts.append("\n" + "-" * 80 + "\n")
+        parts.append("CHANNELS WATCHED IN THE LAST YEAR:\n")
+        parts.append("-" * 80 + "\n\n")
+        parts.extend(
+            f"{i}. {channel['title']}\n"
+            f"   Last watched: {channel['last_watched'].strftime('%Y-%m-%d')}\n\n"
+            for i, channel in enumerate(watched, 1)
+        )
+    
+    # Write the whole report at once rather than line by line
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write("YOUTUBE SUBSCRIPTION ANALYSIS RESULTS\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write(f"Total Subscriptions: {len(unwatched) + len(watched)}\n")
-        f.write(f"Watched in last year: {len(watched)}\n")
-        f.write(f"NOT watched in last year: {len(unwatched)}\n\n")
-        
-        if unwatched:
-            f.write("-" * 80 + "\n")
-            f.write("CHANNELS NOT WATCHED IN OVER ONE YEAR:\n")
-            f.write("-" * 80 + "\n\n")
-            
-            for i, channel in enumerate(unwatched, 1):
-                f.write(f"{i}. {channel['title']}\n")
-                f.write(f"   Channel ID: {channel['channel_id']}\n")
-                f.write(f"   Status: {channel['reason']}\n")
-                f.write(f"   URL: https://www.youtube.com/channel/{channel['channel_id']}\n\n")
-        
-        if watched:
-            f.write("\n" + "-" * 80 + "\n")
-            f.write("CHANNELS WATCHED IN THE LAST YEAR:\n")
-            f.write("-" * 80 + "\n\n")
-            
-            for i, channel in enumerate(watched, 1):
-                f.write(f"{i}. {channel['title']}\n")
-                f.write(f"   Last watched: {channel['last_watched'].strftime('%Y-%m-%d')}\n\n")
+        f.write(''.join(parts))
+    
+    # Machine-readable copy of the same results; datetimes become ISO-8601
+    payload = {
+        'generated': generated,
+        'unwatched': unwatched,
+        'watched': watched
+    }
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2, ensure_ascii=False,
+                          default=datetime.isoformat).encode('utf-8')
+    
+    with open(json_filename, 'wb') as f:
+        f.write(data)
     
     print(f"\nResults saved to: {filename}")
+    print(f"Machine-readable results saved to: {json_filename}")
 
 def main():
     """
@@ -548,41 +974,40 @@ def main():
     
     try:
         # Authenticate with YouTube API (for subscriptions)
-        youtube = get_authenticated_service()
+        creds = get_credentials()
+        youtube = get_authenticated_service(creds)
+        cache = RequestCache()
         
         # Define cutoff date (1 year ago from today)
         cutoff_date = datetime.now() - timedelta(days=365)
         
         # Fetch all subscriptions
-        subscriptions = get_all_subscriptions(youtube)
+        subscriptions = get_all_subscriptions(youtube, cache)
         
         if not subscriptions:
             print("No subscriptions found or unable to fetch subscriptions.")
             return
         
-        # Load watch history from file
-        watch_history = load_watch_history_from_file(watch_history_file, cutoff_date)
+        subs_by_id = index_subscriptions(subscriptions)
+        
+        # Load watch history from file, keeping only subscribed channels
+        watch_history, handle_history = load_watch_history(
+            watch_history_file, cutoff_date, frozenset(subs_by_id))
         
         # Resolve any @username handles to channel IDs
-        if watch_history:
-            handles = [ch_id for ch_id in watch_history.keys() if ch_id.startswith('@') or not ch_id.startswith('UC')]
-            if handles:
-                resolved = resolve_channel_handles(youtube, handles)
-                # Update watch_history with resolved IDs
-                new_history = {}
-                for ch_id, date in watch_history.items():
-                    resolved_id = resolved.get(ch_id, ch_id)
-                    if resolved_id in new_history:
-                        new_history[resolved_id] = max(new_history[resolved_id], date)
-                    else:
-                        new_history[resolved_id] = date
-                watch_history = new_history
+        if handle_history:
+            resolved = resolve_channel_handles(creds, list(handle_history))
+            # Update watch_history with resolved IDs
+            merge_latest(watch_history, (
+                (resolved.get(handle, handle), watched_at)
+                for handle, watched_at in handle_history.items()
+            ))
         
         # Analyze subscriptions
-        unwatched, watched = analyze_subscriptions(subscriptions, watch_history, cutoff_date)
+        unwatched, watched = analyze_subscriptions(subs_by_id, watch_history, cutoff_date)
         
         # Print results
-        print_results(unwatched, watched, len(subscriptions))
+        print_results(unwatched, watched, len(subs_by_id))
         
         # Save results to file
         save_results_to_file(unwatched, watched)
@@ -590,13 +1015,12 @@ def main():
         # Offer to unsubscribe from unwatched channels
         if unwatched:
             print("\n" + "=" * 80)
-            interactive_unsubscribe(youtube, unwatched)
+            interactive_unsubscribe(youtube, unwatched, cache)
         
     except FileNotFoundError as e:
         print(f"\nError: {e}")
     except Exception as e:
         print(f"\nAn unexpected error occurred: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == '__main__':